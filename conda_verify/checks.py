@@ -12,15 +12,22 @@ import hashlib
 import json
 import os
 import re
-import sys
+from collections import Counter, defaultdict
 
 import conda_package_handling.api
+from six import text_type
 
 try:
     from tempfile import TemporaryDirectory
 except:
     from backports.tempfile import TemporaryDirectory
 
+try:
+    # orjson parses bytes directly and is considerably faster, but optional
+    import orjson
+except ImportError:
+    orjson = None
+
 from conda_verify.errors import Error, PackageError
 from conda_verify.constants import FIELDS, LICENSE_FAMILIES, CONDA_FORGE_COMMENTS
 from conda_verify.utilities import (
@@ -28,15 +35,67 @@ from conda_verify.utilities import (
     get_bad_seq,
     get_object_type,
     ensure_list,
-    fullmatch,
     rm_rf,
+    scandir_walk,
 )
 
 
+def json_loads(data):
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson is stricter than the json module (NaN, out of range
+            # numbers, lone surrogates); defer to json for those documents
+            pass
+    return json.loads(data.decode("utf-8"))
+
+
 ver_spec_pat = r"^(?:[><=]{0,2}(?:(?:[\d\*]+[!\._]?){1,})[+\w\*]*[|,]?){1,}"
+# same as utilities.fullmatch(ver_spec_pat, ...), but compiled only once
+ver_spec_full_pat = re.compile("(?:" + ver_spec_pat + r")\Z")
+
+UNALLOWED_DIRECTORIES = frozenset(("conda-meta", "conda-bld", "pkgs", "pkgs32", "envs"))
+UNALLOWED_SUFFIXES = (".DS_Store", "~")
+# <name>-post-link.sh, <name>-pre-unlink.bat and so on
+LINK_SCRIPT_NAMES = frozenset(("post-link", "pre-link", "pre-unlink"))
+LINK_SCRIPT_EXTENSIONS = frozenset((".sh", ".bat"))
+ARCH_SPECIFIC_SUFFIXES = (".so", ".dylib", ".dll", "lib")
+EASY_INSTALL_PREFIXES = (
+    os.path.join("bin", "easy_install"),
+    os.path.join("Scripts", "easy_install"),
+)
+NOARCH_INFO_FILES = (
+    os.path.join("info", "package_metadata.json"),
+    os.path.join("info", "link.json"),
+)
+PREFIX_FILE_MODES = frozenset(("binary", "text"))
+WINDOWS_ARCHS = frozenset(("x86", "x86_64"))
+RECIPE_DISALLOWED_EXTENSIONS = (
+    ".tar",
+    ".tar.gz",
+    ".tar.bz2",
+    ".tar.xz",
+    ".so",
+    ".dylib",
+    ".la",
+    ".a",
+    ".dll",
+    ".pyd",
+)
 
 
-def _checksum(fd, algorithm, buffersize=65536):
+def _splitext(filepath):
+    """Equivalent of os.path.splitext for relative member paths, but cheaper."""
+    basename = filepath.rpartition(os.path.sep)[2].lstrip(".")
+    dot = basename.rfind(".")
+    if dot <= 0:
+        return filepath, ""
+    ext = basename[dot:]
+    return filepath[: -len(ext)], ext
+
+
+def _checksum(fd, algorithm, buffersize=2 * 1024 * 1024):
     hash_impl = getattr(hashlib, algorithm)
     if not hash_impl:
         raise ValueError("Unrecognized hash algorithm: {}".format(algorithm))
@@ -54,6 +113,12 @@ def sha256_checksum(fd):
 class CondaPackageCheck(object):
     """Create checks in order to validate conda package tarballs."""
 
+    name_pat = re.compile(r"[a-z0-9_][a-z0-9_\-\.]*$")
+    hash_pat = re.compile(r"[gh][0-9a-f]{5,}", re.I)
+    version_pat = re.compile(r"[\w\.]+$")
+    # has_prefix fields are whitespace separated but may be quoted to hold spaces
+    prefix_line_pat = re.compile(r"\"[^\"]*\"|'[^']*'|\S+")
+
     def __init__(self, path):
         """Initialize conda package information for use with package checks."""
         super(CondaPackageCheck, self).__init__()
@@ -64,41 +129,78 @@ class CondaPackageCheck(object):
         self.tmpdir = self._tmpdir.name
         conda_package_handling.api.extract(self.path, self.tmpdir)
         self.name, self.version, self.build = self.dist.rsplit("-", 2)
-        self.paths = self.archive_members = [
-            os.path.relpath(os.path.join(dp, f), self.tmpdir)
-            for dp, dn, filenames in os.walk(self.tmpdir)
-            for f in filenames
-        ]
-        with open(os.path.join(self.tmpdir, "info", "index.json"), "rb") as f:
-            self.index = f.read()
-        self.info = json.loads(self.index.decode("utf-8"))
-
-        with open(os.path.join(self.tmpdir, "info", "files"), "rb") as f:
-            self.files_file = f.read()
-
-        try:
-            with open(os.path.join(self.tmpdir, "info", "has_prefix"), "rb") as f:
-                self.prefix_file = f.read()
-        except IOError:
-            self.prefix_file = None
+        # walk the extracted package once; the DirEntry objects are kept so
+        # that later checks can reuse their cached file type and stat info
+        self.paths = self.archive_members = []
+        self.member_entries = {}
+        for entry in scandir_walk(self.tmpdir):
+            member = os.path.relpath(entry.path, self.tmpdir)
+            self.archive_members.append(member)
+            self.member_entries[member] = entry
+        self.index = self._read_info_file("index.json", required=True)
+        self.info = json_loads(self.index)
+
+        self.files_file = self._read_info_file("files", required=True)
+        self._files_file_paths = None
+        self.prefix_file = self._read_info_file("has_prefix")
+        self._prefix_file_contents = None
 
         self.paths_json_path = dict()
-        try:
-            with open(os.path.join(self.tmpdir, 'info', 'paths.json')) as f:
-                self.paths_json = json.load(f)
-                for path in self.paths_json['paths']:
-                    self.paths_json_path[path["_path"]] = path
-        except IOError:
+        paths_json = self._read_info_file("paths.json")
+        if paths_json is not None:
+            self.paths_json = json_loads(paths_json)
+            for path in self.paths_json['paths']:
+                self.paths_json_path[path["_path"]] = path
+        else:
             self.paths_json = {}
 
         self.win_pkg = bool(self.info["platform"] == "win")
-        self.name_pat = re.compile(r"[a-z0-9_][a-z0-9_\-\.]*$")
-        self.hash_pat = re.compile(r"[gh][0-9a-f]{5,}", re.I)
-        self.version_pat = re.compile(r"[\w\.]+$")
+
+        self._classify_paths()
 
     def __exit__(self, exc, value, tb):
         rm_rf(self._tmpdir.name)
 
+    def _read_info_file(self, filename, required=False):
+        """Read the contents of a file in the info directory of the package.
+
+        Optional files missing from the package return None; a missing
+        required file raises IOError just like opening it would.
+        """
+        member = os.path.join("info", filename)
+        if member not in self.member_entries and not required:
+            return None
+        with open(os.path.join(self.tmpdir, member), "rb") as f:
+            return f.read()
+
+    def _classify_paths(self):
+        """Sort the archive members into buckets in a single pass.
+
+        Most path checks only care about members with a given extension,
+        prefix or suffix, so they consult these buckets instead of each
+        scanning every member again.  Buckets keep the archive order.
+        """
+        self._by_ext = defaultdict(list)
+        self._exts_by_root = defaultdict(set)
+        self._easy_install_files = []
+        self._unallowed_files = []
+        self._arch_specific_files = []
+        self._link_scripts = []
+        for filepath in self.paths:
+            root, ext = _splitext(filepath)
+            self._by_ext[ext].append(filepath)
+            self._exts_by_root[root].add(ext)
+            if ext in LINK_SCRIPT_EXTENSIONS:
+                parts = root.rsplit("-", 2)
+                if len(parts) == 3 and "-".join(parts[1:]) in LINK_SCRIPT_NAMES:
+                    self._link_scripts.append(filepath)
+            if filepath.startswith(EASY_INSTALL_PREFIXES):
+                self._easy_install_files.append(filepath)
+            if filepath.endswith(UNALLOWED_SUFFIXES):
+                self._unallowed_files.append(filepath)
+            if filepath.endswith(ARCH_SPECIFIC_SUFFIXES):
+                self._arch_specific_files.append(filepath)
+
     @staticmethod
     def retrieve_package_name(path):
         """Retrieve the package name from the conda package path."""
@@ -234,7 +336,7 @@ class CondaPackageCheck(object):
                     )
                 elif (
                     len(dependency_parts) == 2
-                    and not fullmatch(ver_spec_pat, dependency_parts[1])
+                    and not ver_spec_full_pat.match(dependency_parts[1])
                     or len(dependency_parts) > 3
                 ):
                     return Error(
@@ -264,18 +366,17 @@ class CondaPackageCheck(object):
 
     def check_members(self):
         """Check the tar archive members for non ascii characters."""
-        for member in self.archive_members:
-            if sys.version_info.major == 2:
-                unicode_path = member.decode("utf-8")
-            else:
-                unicode_path = member.encode("utf-8")
-
-            if not all_ascii(unicode_path):
-                return Error(
-                    self.path,
-                    "C1118",
-                    "Found archive member names containing non-ascii characters",
-                )
+        # the error does not name a member, so one scan over all names
+        # suffices; LF is accepted by all_ascii, so it is a safe separator
+        members = "\n".join(self.archive_members)
+        if isinstance(members, text_type):
+            members = members.encode("utf-8", "surrogateescape")
+        if not all_ascii(members):
+            return Error(
+                self.path,
+                "C1118",
+                "Found archive member names containing non-ascii characters",
+            )
 
     def check_files_file_encoding(self):
         """Check the info/files file for non ascii characters."""
@@ -286,12 +387,18 @@ class CondaPackageCheck(object):
                 "Found filenames in info/files containing non-ascii characters",
             )
 
+    @property
+    def files_file_paths(self):
+        """Return the stripped lines of info/files, decoding the file only once."""
+        if self._files_file_paths is None:
+            self._files_file_paths = [
+                path.strip() for path in self.files_file.decode("utf-8").splitlines()
+            ]
+        return self._files_file_paths
+
     def check_files_file_for_info(self):
         """Check that the info/files file does not contain any files found within the info directory."""
-        filenames = [
-            path.strip() for path in self.files_file.decode("utf-8").splitlines()
-        ]
-        for filename in filenames:
+        for filename in self.files_file_paths:
             if filename.startswith("info"):
                 return Error(
                     self.path,
@@ -301,28 +408,34 @@ class CondaPackageCheck(object):
 
     def check_files_file_for_duplicates(self):
         """Check the info/files file for duplicates."""
-        filenames = [
-            path.strip() for path in self.files_file.decode("utf-8").splitlines()
-        ]
+        filenames = self.files_file_paths
         if len(filenames) != len(set(filenames)):
-            return Error(self.path, "C1121", "Found duplicate filenames in info/files")
+            duplicates = sorted(
+                filename for filename, count in Counter(filenames).items() if count > 1
+            )
+            return Error(
+                self.path,
+                "C1121",
+                u"Found duplicate filenames in info/files: {}".format(
+                    ", ".join(duplicates)
+                ),
+            )
 
     def check_files_file_for_validity(self):
         """Check that the files listed in info/files exist in the tar archive and vice versa."""
         members = set([
-            member
-            for member in self.archive_members
-            if not os.path.isdir(os.path.join(self.tmpdir, member))
-            and not member.startswith("info")
+            member for member in self.archive_members if not member.startswith("info")
         ])
         filenames = set([
-            os.path.normpath(path.strip())
-            for path in self.files_file.decode("utf-8").splitlines()
-            if not path.strip().startswith("info")
+            os.path.normpath(path)
+            for path in self.files_file_paths
+            if not path.startswith("info")
         ])
+        if members == filenames:
+            return
 
-        sorted_union_filenames = sorted(members.union(filenames))
-        for filename in sorted_union_filenames:
+        # only names missing from one side can fail, so sort just those
+        for filename in sorted(members.symmetric_difference(filenames)):
             if filename not in members:
                 return Error(
                     self.path,
@@ -343,7 +456,7 @@ class CondaPackageCheck(object):
     def check_for_hardlinks(self):
         """Check the tar archive for hardlinks."""
         for member in self.archive_members:
-            if os.path.islink(os.path.join(self.tmpdir, member)):
+            if self.member_entries[member].is_symlink():
                 return Error(
                     self.path,
                     "C1124",
@@ -352,25 +465,26 @@ class CondaPackageCheck(object):
 
     def check_for_unallowed_files(self):
         """Check the tar archive for unallowed directories."""
-        unallowed_directories = {"conda-meta", "conda-bld", "pkgs", "pkgs32", "envs"}
+        unallowed = UNALLOWED_DIRECTORIES.intersection(self.member_entries)
+        if unallowed:
+            return Error(
+                self.path,
+                "C1125",
+                u"Found unallowed file in tar archive: {}".format(min(unallowed)),
+            )
 
-        for filepath in self.paths:
-            if filepath in unallowed_directories or filepath.endswith(
-                (".DS_Store", "~")
-            ):
-                return Error(
-                    self.path,
-                    "C1125",
-                    u"Found unallowed file in tar archive: {}".format(filepath),
-                )
+        if self._unallowed_files:
+            filepath = self._unallowed_files[0]
+            return Error(
+                self.path,
+                "C1125",
+                u"Found unallowed file in tar archive: {}".format(filepath),
+            )
 
     def check_for_noarch_info(self):
         """Check that noarch Python packages contain the proper metadata files."""
-        for filepath in self.paths:
-            if filepath in (
-                os.path.join("info", "package_metadata.json"),
-                os.path.join("info", "link.json"),
-            ):
+        for filepath in NOARCH_INFO_FILES:
+            if filepath in self.member_entries:
                 if self.info["subdir"] != "noarch" and "preferred_env" not in self.info:
                     return Error(
                         self.path,
@@ -382,14 +496,11 @@ class CondaPackageCheck(object):
 
     def check_for_bat_and_exe(self):
         """Check that both .bat and .exe files don't exist in the same package."""
-        bat_files = [
-            filepath[:-4] for filepath in self.paths if filepath.endswith(".bat")
-        ]
-        exe_files = [
-            filepath[:-4] for filepath in self.paths if filepath.endswith(".exe")
-        ]
-
-        isect = set(bat_files).intersection(exe_files)
+        isect = set(
+            root
+            for root, exts in self._exts_by_root.items()
+            if ".bat" in exts and ".exe" in exts
+        )
         if len(isect) > 0:
             return Error(
                 self.path,
@@ -411,27 +522,29 @@ class CondaPackageCheck(object):
     def prefix_file_contents(self):
         """Extract the contents of the has_prefix file and return them.
 
-        If the has_prefix file does not exist, None is returned.
+        If the has_prefix file does not exist, None is returned.  The file
+        is parsed on first access only, as several checks share the result.
         """
-        if self.prefix_file is not None:
+        if self._prefix_file_contents is None and self.prefix_file is not None:
             for line in self.prefix_file.decode("utf-8").splitlines():
                 line = line.strip()
-                try:
-                    placeholder, mode, filename = line.split()
-                    placeholder = placeholder.strip("'\"")
-                    filename = filename.strip("'\"")
-                except ValueError:
+                parts = self.prefix_line_pat.findall(line)
+                if len(parts) == 3:
+                    placeholder, mode, filename = (part.strip("'\"") for part in parts)
+                else:
                     placeholder, mode, filename = "/<dummy>/<placeholder>", "text", line
 
-                return (placeholder, mode, filename)
-        return None
+                self._prefix_file_contents = (placeholder, mode, filename)
+                break
+        return self._prefix_file_contents
 
     def check_prefix_file_filename(self):
         """Check that the filenames in has_prefix exist in the archive."""
-        if self.prefix_file_contents is not None:
-            _, _, filename = self.prefix_file_contents
+        prefix_file_contents = self.prefix_file_contents
+        if prefix_file_contents is not None:
+            _, _, filename = prefix_file_contents
 
-            if os.path.normpath(filename) not in self.paths:
+            if os.path.normpath(filename) not in self.member_entries:
                 return Error(
                     self.path,
                     "C1129",
@@ -442,10 +555,11 @@ class CondaPackageCheck(object):
 
     def check_prefix_file_mode(self):
         """Check that the has_prefix mode is either binary or text."""
-        if self.prefix_file_contents is not None:
-            _, mode, _ = self.prefix_file_contents
+        prefix_file_contents = self.prefix_file_contents
+        if prefix_file_contents is not None:
+            _, mode, _ = prefix_file_contents
 
-            if mode not in ["binary", "text"]:
+            if mode not in PREFIX_FILE_MODES:
                 return Error(
                     self.path,
                     "C1130",
@@ -454,8 +568,9 @@ class CondaPackageCheck(object):
 
     def check_prefix_file_binary_mode(self):
         """Check that the has_prefix file binary mode is correct."""
-        if self.prefix_file_contents is not None:
-            placeholder, mode, _ = self.prefix_file_contents
+        prefix_file_contents = self.prefix_file_contents
+        if prefix_file_contents is not None:
+            placeholder, mode, _ = prefix_file_contents
 
             if mode == "binary":
                 if self.name == "python":
@@ -481,64 +596,54 @@ class CondaPackageCheck(object):
 
     def check_for_post_links(self):
         """Check the tar archive for pre and post link files."""
-        for filepath in self.paths:
-            if filepath.endswith(
-                (
-                    "-post-link.sh",
-                    "-pre-link.sh",
-                    "-pre-unlink.sh",
-                    "-post-link.bat",
-                    "-pre-link.bat",
-                    "-pre-unlink.bat",
-                )
-            ):
-                return Error(
-                    self.path,
-                    "C1134",
-                    u'Found pre/post link file "{}" in archive'.format(filepath),
-                )
+        if self._link_scripts:
+            filepath = self._link_scripts[0]
+            return Error(
+                self.path,
+                "C1134",
+                u'Found pre/post link file "{}" in archive'.format(filepath),
+            )
 
     def check_for_egg(self):
         """Check the tar archive for egg files."""
-        for filepath in self.paths:
-            if filepath.endswith(".egg"):
-                return Error(
-                    self.path,
-                    "C1135",
-                    u'Found egg file "{}" in archive'.format(filepath),
-                )
+        filepaths = self._by_ext.get(".egg", ())
+        if filepaths:
+            filepath = filepaths[0]
+            return Error(
+                self.path,
+                "C1135",
+                u'Found egg file "{}" in archive'.format(filepath),
+            )
 
     def check_for_easy_install_script(self):
         """Check the tar archive for easy_install scripts."""
-        for filepath in self.paths:
-            if filepath.startswith(
-                (
-                    os.path.join("bin", "easy_install"),
-                    os.path.join("Scripts", "easy_install"),
-                )
-            ):
-                return Error(
-                    self.path,
-                    "C1136",
-                    u'Found easy_install script "{}" in archive'.format(filepath),
-                )
+        if self._easy_install_files:
+            filepath = self._easy_install_files[0]
+            return Error(
+                self.path,
+                "C1136",
+                u'Found easy_install script "{}" in archive'.format(filepath),
+            )
 
     def check_for_pth_file(self):
         """Check the tar archive for .pth files."""
-        for filepath in self.paths:
-            if filepath.endswith(".pth"):
-                return Error(
-                    self.path,
-                    "C1137",
-                    u'Found namespace file "{}" in archive'.format(
-                        os.path.normpath(filepath)
-                    ),
-                )
+        filepaths = self._by_ext.get(".pth", ())
+        if filepaths:
+            filepath = filepaths[0]
+            return Error(
+                self.path,
+                "C1137",
+                u'Found namespace file "{}" in archive'.format(
+                    os.path.normpath(filepath)
+                ),
+            )
 
     def check_for_pyo_file(self):
         """Check the tar archive for .pyo files"""
-        for filepath in self.paths:
-            if filepath.endswith(".pyo") and self.name != "python":
+        if self.name != "python":
+            filepaths = self._by_ext.get(".pyo", ())
+            if filepaths:
+                filepath = filepaths[0]
                 return Error(
                     self.path,
                     "C1138",
@@ -547,12 +652,8 @@ class CondaPackageCheck(object):
 
     def check_for_pyc_in_site_packages(self):
         """Check that .pyc files are only found within the site-packages or disutils directories."""
-        for filepath in self.paths:
-            if (
-                filepath.endswith(".pyc")
-                and "site-packages" not in filepath
-                and "distutils" not in filepath
-            ):
+        for filepath in self._by_ext.get(".pyc", ()):
+            if "site-packages" not in filepath and "distutils" not in filepath:
                 return Error(
                     self.path,
                     "C1139",
@@ -561,8 +662,8 @@ class CondaPackageCheck(object):
 
     def check_for_2to3_pickle(self):
         """Check the tar archive for .pickle files."""
-        for filepath in self.paths:
-            if "lib2to3" in filepath and filepath.endswith(".pickle"):
+        for filepath in self._by_ext.get(".pickle", ()):
+            if "lib2to3" in filepath:
                 return Error(
                     self.path,
                     "C1140",
@@ -572,9 +673,9 @@ class CondaPackageCheck(object):
     def check_pyc_files(self):
         """Check that a .pyc file exists for every .py file in a Python 2 package."""
         if "py3" not in self.build:
-            for filepath in self.paths:
+            for filepath in self._by_ext.get(".py", ()):
                 if "site-packages" in filepath:
-                    if filepath.endswith(".py") and (filepath + "c") not in self.paths:
+                    if (filepath + "c") not in self.member_entries:
                         return Error(
                             self.path,
                             "C1141",
@@ -587,8 +688,8 @@ class CondaPackageCheck(object):
         """Check that the Menu/package.json filename is identical to the package name."""
         menu_json_files = [
             filepath
-            for filepath in self.paths
-            if filepath.startswith("Menu" + os.path.sep) and filepath.endswith(".json")
+            for filepath in self._by_ext.get(".json", ())
+            if filepath.startswith("Menu" + os.path.sep)
         ]
 
         if len(menu_json_files) == 1:
@@ -606,7 +707,7 @@ class CondaPackageCheck(object):
         """Check that Windows package .exes and .dlls contain the correct headers."""
         if self.win_pkg:
             arch = self.info["arch"]
-            if arch not in ("x86", "x86_64"):
+            if arch not in WINDOWS_ARCHS:
                 return Error(
                     self.path,
                     "C1144",
@@ -615,7 +716,7 @@ class CondaPackageCheck(object):
 
             for member in self.archive_members:
                 if member.endswith((".exe", ".dll")):
-                    with open(os.path.join(self.tmpdir, member), "rb") as file_object:
+                    with open(self.member_entries[member].path, "rb") as file_object:
                         file_header = file_object.read(4096)
                         file_object_type = get_object_type(file_header)
                         if (arch == "x86" and file_object_type != "DLL I386") or (
@@ -633,11 +734,11 @@ class CondaPackageCheck(object):
     def check_package_hashes_and_size(self):
         """Check the sha256 checksum and filesize of each file in the package."""
         for member in self.archive_members:
-            file_path = os.path.join(self.tmpdir, member)
+            entry = self.member_entries[member]
             if member in self.paths_json_path:
-                if os.path.isfile(file_path):
+                if entry.is_file():
                     path = self.paths_json_path[member]
-                    size = os.stat(file_path).st_size
+                    size = entry.stat().st_size
                     if size != path["size_in_bytes"]:
                         return Error(
                             self.path,
@@ -646,7 +747,7 @@ class CondaPackageCheck(object):
                                 member
                             ),
                         )
-                    with open(file_path, "rb") as file_object:
+                    with open(entry.path, "rb") as file_object:
                         sha256_digest = sha256_checksum(file_object)
                     if sha256_digest != path["sha256"]:
                         return Error(
@@ -660,33 +761,34 @@ class CondaPackageCheck(object):
     def check_noarch_files(self):
         """Check that noarch packages do not contain architecture specific files."""
         if self.info["subdir"] == "noarch":
-            for filepath in self.paths:
-                if filepath.endswith((".so", ".dylib", ".dll", "lib")):
-                    return Error(
-                        self.path,
-                        "C1148",
-                        u'Found architecture specific file "{}" in package.'.format(
-                            filepath
-                        ),
-                    )
+            if self._arch_specific_files:
+                filepath = self._arch_specific_files[0]
+                return Error(
+                    self.path,
+                    "C1148",
+                    u'Found architecture specific file "{}" in package.'.format(
+                        filepath
+                    ),
+                )
 
 
 class CondaRecipeCheck(object):
     """Create checks in order to validate conda recipes."""
 
+    name_pat = re.compile(r"[a-z0-9_][a-z0-9_\-\.]*$")
+    version_pat = re.compile(r"[\w\.]+$")
+    url_pat = re.compile(r"(ftp|http(s)?)://")
+    hash_pat = {
+        "md5": re.compile(r"[a-f0-9]{32}$"),
+        "sha1": re.compile(r"[a-f0-9]{40}$"),
+        "sha256": re.compile(r"[a-f0-9]{64}$"),
+    }
+
     def __init__(self, meta, recipe_dir):
         """Initialize conda recipe information for use with recipe checks."""
         super(CondaRecipeCheck, self).__init__()
         self.meta = meta
         self.recipe_dir = recipe_dir
-        self.name_pat = re.compile(r"[a-z0-9_][a-z0-9_\-\.]*$")
-        self.version_pat = re.compile(r"[\w\.]+$")
-        self.url_pat = re.compile(r"(ftp|http(s)?)://")
-        self.hash_pat = {
-            "md5": re.compile(r"[a-f0-9]{32}$"),
-            "sha1": re.compile(r"[a-f0-9]{40}$"),
-            "sha256": re.compile(r"[a-f0-9]{64}$"),
-        }
 
     def check_package_name(self):
         """Check the package name in meta.yaml for proper formatting."""
@@ -802,21 +904,23 @@ class CondaRecipeCheck(object):
 
     def check_requirements(self):
         """Check that the requirements listed in meta.yaml are valid."""
-        build_requirements = self.meta.get("requirements", {}).get("build", [])
-        run_requirements = self.meta.get("requirements", {}).get("run", [])
+        requirements = self.meta.get("requirements", {})
+        build_requirements = requirements.get("build", [])
+        run_requirements = requirements.get("run", [])
+        build_requirement_set = set(build_requirements)
 
         for requirement in build_requirements + run_requirements:
             requirement_parts = requirement.split()
             requirement_name = requirement_parts[0]
 
             if not self.name_pat.match(requirement_name):
-                if requirement in build_requirements:
+                if requirement in build_requirement_set:
                     return Error(
                         self.recipe_dir,
                         "C2111",
                         u'Found invalid build requirement "{}"'.format(requirement),
                     )
-                elif requirement in run_requirements:
+                else:
                     return Error(
                         self.recipe_dir,
                         "C2112",
@@ -828,8 +932,8 @@ class CondaRecipeCheck(object):
                     self.recipe_dir, "C2113", "Found empty dependencies in meta.yaml"
                 )
 
-            elif len(requirement_parts) >= 2 and not fullmatch(
-                ver_spec_pat, requirement_parts[1]
+            elif len(requirement_parts) >= 2 and not ver_spec_full_pat.match(
+                requirement_parts[1]
             ):
                 return Error(
                     self.recipe_dir,
@@ -837,7 +941,7 @@ class CondaRecipeCheck(object):
                     u'Found invalid dependency "{}" in meta.yaml'.format(requirement),
                 )
 
-        if len(build_requirements) != len(set(build_requirements)):
+        if len(build_requirements) != len(build_requirement_set):
             return Error(
                 self.recipe_dir,
                 "C2115",
@@ -853,7 +957,8 @@ class CondaRecipeCheck(object):
 
     def check_about(self):
         """Check the about field in meta.yaml for proper formatting."""
-        summary = self.meta.get("about", {}).get("summary")
+        about = self.meta.get("about", {})
+        summary = about.get("summary")
 
         if summary is not None and len(summary) > 80:
             return Error(
@@ -862,12 +967,12 @@ class CondaRecipeCheck(object):
                 "Found summary with length greater than 80 characters",
             )
 
-        home = self.meta.get("about", {}).get("home")
-        dev_url = self.meta.get("about", {}).get("dev_url")
-        doc_url = self.meta.get("about", {}).get("doc_url")
-        license_url = self.meta.get("about", {}).get("license_url")
-
-        for url in [home, dev_url, doc_url, license_url]:
+        for url in (
+            about.get("home"),
+            about.get("dev_url"),
+            about.get("doc_url"),
+            about.get("license_url"),
+        ):
             if url is not None and not self.url_pat.match(url):
                 return Error(
                     self.recipe_dir,
@@ -913,9 +1018,8 @@ class CondaRecipeCheck(object):
 
     def check_license_family(self):
         """Check that the license family listed in meta.yaml is valid."""
-        license_family = self.meta.get("about", {}).get(
-            "license_family", self.meta.get("about", {}).get("license")
-        )
+        about = self.meta.get("about", {})
+        license_family = about.get("license_family", about.get("license"))
 
         if license_family is not None and license_family not in LICENSE_FAMILIES:
             return Error(
@@ -926,8 +1030,9 @@ class CondaRecipeCheck(object):
 
     def check_for_valid_files(self):
         """Check that the files listed in meta.yaml exist."""
-        test_files = self.meta.get("test", {}).get("files", [])
-        test_source_files = self.meta.get("test", {}).get("source_files", [])
+        test = self.meta.get("test", {})
+        test_files = test.get("files", [])
+        test_source_files = test.get("source_files", [])
         sources = ensure_list(self.meta.get("source", {}))
         source_patches = []
         for source in sources:
@@ -953,28 +1058,13 @@ class CondaRecipeCheck(object):
 
     def check_dir_content(self):
         """Check for disallowed files inside the recipe directory."""
-        disallowed_extensions = (
-            ".tar",
-            ".tar.gz",
-            ".tar.bz2",
-            ".tar.xz",
-            ".so",
-            ".dylib",
-            ".la",
-            ".a",
-            ".dll",
-            ".pyd",
-        )
-
-        for dirpath, _, filenames in os.walk(self.recipe_dir):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if filepath.endswith(disallowed_extensions):
-                    return Error(
-                        self.recipe_dir,
-                        "C2125",
-                        u'Found disallowed file with extension "{}"'.format(filepath),
-                    )
+        for entry in scandir_walk(self.recipe_dir):
+            if entry.name.endswith(RECIPE_DISALLOWED_EXTENSIONS):
+                return Error(
+                    self.recipe_dir,
+                    "C2125",
+                    u'Found disallowed file with extension "{}"'.format(entry.path),
+                )
 
     def check_recipes_comments(self):
         """Check for default comments in conda-forge example recipe."""
@@ -13,21 +13,18 @@ from conda_verify.verify import Verify
 from conda_verify.utilities import DummyExecutor, render_metadata, iter_cfgs
 
 
+def _verify_recipe(path, cfg, ignore):
+    # rendering is the expensive part, so it happens in the worker as well
+    meta = render_metadata(path, cfg)
+    if meta.get("build", {}).get("skip", "").lower() == "true":
+        return path, None
+    return Verify.verify_recipe(
+        rendered_meta=meta, recipe_dir=path, checks_to_ignore=ignore, exit_on_error=False
+    )
+
+
 def _submit_verify_recipe(path, executor, ignore):
-    futures = []
-    for cfg in iter_cfgs():
-        meta = render_metadata(path, cfg)
-        if meta.get("build", {}).get("skip", "").lower() != "true":
-            futures.append(
-                executor.submit(
-                    Verify.verify_recipe,
-                    rendered_meta=meta,
-                    recipe_dir=path,
-                    checks_to_ignore=ignore,
-                    exit_on_error=False,
-                )
-            )
-    return futures
+    return [executor.submit(_verify_recipe, path, cfg, ignore) for cfg in iter_cfgs()]
 
 
 def _submit_verify_package(path, ignore):
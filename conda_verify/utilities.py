@@ -1,4 +1,5 @@
 import re
+import struct
 import sys
 from os import environ, getcwd, listdir, makedirs, rename, rmdir, unlink
 from os.path import abspath, basename, dirname, exists, isdir, isfile, join, normpath, split, islink, lexists
@@ -7,12 +8,10 @@ import shutil
 
 import jinja2
 import yaml
-from six import string_types
+from six import string_types, text_type
 from concurrent.futures import Future, Executor
 from threading import Lock
 
-import future.builtins
-
 from conda_verify.constants import MAGIC_HEADERS, DLL_TYPES
 
 try:
@@ -20,6 +19,11 @@ try:
 except ImportError:
     from backports.functools_lru_cache import lru_cache
 
+try:
+    from os import scandir
+except ImportError:
+    from scandir import scandir
+
 
 @lru_cache(maxsize=32)
 def yamlize(data):
@@ -127,34 +131,68 @@ def get_object_type(data):
         return None
     lookup = MAGIC_HEADERS.get(head)
     if lookup == "DLL":
-        pos = data.find(b"PE\0\0")
-        if pos < 0:
+        # e_lfanew at offset 0x3C of the DOS header points to the PE signature,
+        # which is directly followed by the machine type of the COFF header
+        try:
+            pos = struct.unpack_from("<I", data, 0x3C)[0]
+            if data[pos:pos + 4] != b"PE\0\0":
+                return "<no PE header found>"
+            machine = struct.unpack_from("<H", data, pos + 4)[0]
+        except struct.error:
             return "<no PE header found>"
-        data = future.builtins.bytes(data)
-        i = data[pos + 4] + 256 * data[pos + 5]
-        return "DLL " + DLL_TYPES.get(i)
+        return "DLL " + DLL_TYPES.get(machine, "UNKNOWN")
     elif lookup.startswith("MachO"):
         return lookup
     elif lookup == "ELF":
         return "ELF" + {"\x01": "32", "\x02": "64"}.get(data[4])
 
 
+BAD_SEQS = ("--", "-.", "-_", ".-", "..", "._", "_-", "_.")  # but '__' is fine
+bad_seq_pat = re.compile("|".join(re.escape(seq) for seq in BAD_SEQS))
+
+
 def get_bad_seq(s):
-    for seq in ("--", "-.", "-_", ".-", "..", "._", "_-", "_."):  # but '__' is fine
-        if seq in s:
-            return seq
-    return None
+    m = bad_seq_pat.search(s)
+    return m.group(0) if m else None
+
+
+# printable ascii plus LF, optionally also CR
+ASCII_BYTES = bytes(bytearray([10] + list(range(32, 127))))
+ASCII_BYTES_CR = ASCII_BYTES + b"\r"
 
 
 def all_ascii(data, allow_CR=False):
-    newline = [10]  # LF
-    if allow_CR:
-        newline.append(13)  # CR
-    for c in data:
-        n = ord(c) if sys.version_info[0] == 2 else c
-        if not (n in newline or 32 <= n < 127):
-            return False
-    return True
+    if isinstance(data, text_type):
+        data = data.encode("utf-8")
+    # deleting every allowed byte leaves only the offending ones; translate
+    # does this in a single C-level pass instead of a Python loop per byte
+    return not data.translate(None, ASCII_BYTES_CR if allow_CR else ASCII_BYTES)
+
+
+def scandir_walk(top):
+    """Yield a DirEntry for every non-directory found below top.
+
+    Entries are produced in the same order as os.walk would list the files,
+    and symlinks to directories are likewise not descended into.  The entries
+    cache the file type from the directory read, so callers can inspect them
+    without issuing another stat call per file.
+    """
+    # read the whole directory up front so the iterator is closed even when
+    # the caller stops early; unreadable directories are skipped like os.walk
+    try:
+        entries = list(scandir(top))
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        if entry.is_dir():
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        else:
+            yield entry
+    for subdir in subdirs:
+        for entry in scandir_walk(subdir):
+            yield entry
 
 
 def ensure_list(argument):
@@ -6,9 +6,9 @@ from setuptools import setup
 
 import versioneer
 
-requirements = ['click >= 6.7', 'future >= 0.12.0', 'jinja2 >= 2.9', 'pyyaml >= 3.12', 'six']
+requirements = ['click >= 6.7', 'jinja2 >= 2.9', 'pyyaml >= 3.12', 'six']
 if sys.version_info.major == 2:
-    requirements.extend(['backports.tempfile', 'backports.functools_lru_cache >= 1.4'])
+    requirements.extend(['backports.tempfile', 'backports.functools_lru_cache >= 1.4', 'scandir'])
 
 
 setup(
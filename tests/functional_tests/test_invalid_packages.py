@@ -65,7 +65,7 @@ def test_duplicates_in_files_file(package_dir, verifier):
         verifier.verify_package(path_to_package=package, exit_on_error=True)
     package, errors = verifier.verify_package(path_to_package=package, exit_on_error=False)
 
-    assert '[C1121] Found duplicate filenames in info/files' in errors
+    assert '[C1121] Found duplicate filenames in info/files: testfile.txt' in errors
 
 
 def test_not_in_files_file(package_dir, verifier):
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import math
+import os
+
+from conda_verify.checks import CondaRecipeCheck, json_loads
+
+
+def test_dir_content_missing_recipe_dir(tmpdir):
+    recipe_check = CondaRecipeCheck({}, os.path.join(str(tmpdir), "missing"))
+    assert recipe_check.check_dir_content() is None
+
+
+def test_dir_content_disallowed_file(tmpdir):
+    os.makedirs(os.path.join(str(tmpdir), "sub"))
+    for filename in ("meta.yaml", os.path.join("sub", "libtest.so")):
+        with open(os.path.join(str(tmpdir), filename), "w") as f:
+            f.write("test")
+    error = CondaRecipeCheck({}, str(tmpdir)).check_dir_content()
+    assert error.code == "C2125"
+    assert error.message.endswith('libtest.so"')
+
+
+
+def test_json_loads():
+    assert json_loads(b'{"name": "test", "build_number": 0}') == {"name": "test", "build_number": 0}
+    # documents the json module accepts but orjson rejects
+    assert math.isnan(json_loads(b'{"a": NaN}')["a"])
+    assert json_loads(b'{"a": 1e400}')["a"] == float("inf")
+    assert json_loads(b'{"a": "\\udcff"}')["a"] == u"\udcff"
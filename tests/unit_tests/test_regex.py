@@ -51,3 +51,19 @@ def test_ver_spec_pat(package_dir, recipe_dir):
     assert utilities.fullmatch(recipe_ver_spec_pat, or_version)
     assert utilities.fullmatch(recipe_ver_spec_pat, regex_version)
     assert utilities.fullmatch(recipe_ver_spec_pat, python_version)
+
+
+def test_ver_spec_full_pat():
+    for version in ('>=1.2', '==1.2.2', '>=2,<3', '<=2.0.0*,<3.0.0*', '2.0rc1',
+                    '>=1.9.3,<2.0.0a0', '1.0|1.2.*', '3.6*', '3.6.*'):
+        assert checks.ver_spec_full_pat.match(version)
+        assert utilities.fullmatch(checks.ver_spec_pat, version)
+    assert not checks.ver_spec_full_pat.match('>===3.5')
+
+
+def test_prefix_line_pat():
+    pat = checks.CondaPackageCheck.prefix_line_pat
+    assert pat.findall('/p text "bin/my file"') == ['/p', 'text', '"bin/my file"']
+    assert pat.findall('"/p h" binary lib/x.so') == ['"/p h"', 'binary', 'lib/x.so']
+    assert pat.findall("/p text bin/it's") == ['/p', 'text', "bin/it's"]
+    assert pat.findall('bin/test') == ['bin/test']
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+import os
+import sys
+
+import pytest
+
+from conda_verify import utilities
+
+
+def test_all_ascii():
+    assert utilities.all_ascii(b"")
+    assert utilities.all_ascii(b"info/index.json\nbin/test\n")
+    assert not utilities.all_ascii(b"bin/t\xc3\xa9st\n")
+    assert not utilities.all_ascii(b"bin/test\t\n")
+    assert not utilities.all_ascii(b"bin/test\x7f")
+
+
+def test_all_ascii_allow_CR():
+    assert not utilities.all_ascii(b"bin/test\r\n")
+    assert utilities.all_ascii(b"bin/test\r\n", allow_CR=True)
+    assert not utilities.all_ascii(b"bin/t\xc3\xa9st\r\n", allow_CR=True)
+
+
+def test_all_ascii_text():
+    assert utilities.all_ascii(u"bin/test")
+    assert not utilities.all_ascii(u"bin/tést")
+
+
+def test_all_ascii_joined_member_names():
+    def joined(*names):
+        return u"\n".join(names).encode("utf-8", "surrogateescape")
+
+    assert utilities.all_ascii(joined(u"info/index.json", u"lib/python3.6/test.py"))
+    for member in (u"bin/tést", u"bin/a\tb", u"bin/a\x7fb", u"bin/a\x01b", u"bin/t\udcffst"):
+        assert not utilities.all_ascii(joined(u"info/index.json", member))
+
+
+def _pe_header(machine, e_lfanew=0x80):
+    header = bytearray(4096)
+    header[:4] = b"MZ\x90\x00"
+    header[0x3C:0x40] = bytearray([e_lfanew, 0, 0, 0])
+    header[e_lfanew:e_lfanew + 6] = b"PE\0\0" + bytearray([machine & 0xFF, machine >> 8])
+    return bytes(header)
+
+
+def test_get_object_type_dll():
+    assert utilities.get_object_type(_pe_header(0x14C)) == "DLL I386"
+    assert utilities.get_object_type(_pe_header(0x8664, e_lfanew=0xF8)) == "DLL AMD64"
+
+
+def test_get_object_type_no_pe_header():
+    header = bytearray(_pe_header(0x8664))
+    header[0x80:0x84] = b"NE\0\0"
+    assert utilities.get_object_type(bytes(header)) == "<no PE header found>"
+    assert utilities.get_object_type(b"MZ\x90\x00") == "<no PE header found>"
+    assert utilities.get_object_type(b"#!/bin/sh\n") is None
+
+
+def test_get_bad_seq():
+    for seq in ("--", "-.", "-_", ".-", "..", "._", "_-", "_."):
+        assert utilities.get_bad_seq("test{}file".format(seq)) == seq
+    assert utilities.get_bad_seq("test__file-1.0.0") is None
+    assert utilities.get_bad_seq("test-file..0-_1") == ".."
+
+
+def _make_tree(root):
+    for directory in ("bin", os.path.join("lib", "pkg"), "info"):
+        os.makedirs(os.path.join(root, directory))
+    for filename in ("a.txt", os.path.join("bin", "tool"), os.path.join("lib", "libx.so"),
+                     os.path.join("lib", "pkg", "__init__.py"), os.path.join("info", "files")):
+        with open(os.path.join(root, filename), "w") as f:
+            f.write("test")
+
+
+def _walk_files(root):
+    return [
+        os.path.relpath(os.path.join(dirpath, filename), root)
+        for dirpath, _, filenames in os.walk(root)
+        for filename in filenames
+    ]
+
+
+def test_scandir_walk_matches_os_walk(tmpdir):
+    root = str(tmpdir)
+    _make_tree(root)
+    walked = [os.path.relpath(entry.path, root) for entry in utilities.scandir_walk(root)]
+    assert walked == _walk_files(root)
+    assert len(walked) == 5
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="symlinks need privileges on Windows")
+def test_scandir_walk_symlinks(tmpdir):
+    root = str(tmpdir)
+    _make_tree(root)
+    os.symlink(os.path.join(root, "lib"), os.path.join(root, "lib-link"))
+    os.symlink(os.path.join(root, "a.txt"), os.path.join(root, "bin", "a-link"))
+    entries = list(utilities.scandir_walk(root))
+    walked = [os.path.relpath(entry.path, root) for entry in entries]
+    assert walked == _walk_files(root)
+    assert not any(path.startswith("lib-link") for path in walked)
+    links = [entry for entry in entries if entry.is_symlink()]
+    assert [os.path.relpath(entry.path, root) for entry in links] == [
+        os.path.join("bin", "a-link")
+    ]
+
+
+def test_scandir_walk_missing_directory(tmpdir):
+    assert list(utilities.scandir_walk(os.path.join(str(tmpdir), "missing"))) == []